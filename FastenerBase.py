@@ -213,23 +213,20 @@ def FSGetToolbarItem(tname, iname):
 FSCache = {}
 
 
+# keys are plain tuples of the (non None) arguments, hashed without any string formatting
 def FSGetKey(*args):
-    obj = None
-    key = 'FS'
-    for arg in args:
-        if not arg is None:
-            key = key + '|' + str(arg)
-    if key in FSCache:
-        FreeCAD.Console.PrintLog("Using cached shape for: " + key + "\n")
-        return (key, FSCache[key])
-    return (key, None)
+    key = ('FS',) + tuple(arg for arg in args if arg is not None)
+    res = FSCache.get(key)
+    if res is not None:
+        FreeCAD.Console.PrintLog("Using cached shape for: " + str(key) + "\n")
+    return (key, res)
 
 
 # removes all cached fasteners with real thread
 def FSCacheRemoveThreaded():
     for key in list(FSCache.keys()):
-        if key.find('thread:True') > 0:
-            FreeCAD.Console.PrintLog("Removing cached shape: " + key + "\n")
+        if any(isinstance(k, str) and 'thread:True' in k for k in key):
+            FreeCAD.Console.PrintLog("Removing cached shape: " + str(key) + "\n")
             del FSCache[key]
 
 # extruct the diameter code (metric/imperial) from the given string
@@ -351,6 +348,8 @@ def GetTotalObjectRepeats(obj):
 class FSFaceMaker:
     '''Create a face point by point on the x,z plane'''
 
+    __slots__ = ('edges', 'firstPoint', 'lastPoint')
+
     def __init__(self):
         self.Reset()
 
@@ -69,15 +69,7 @@ def makeCupNut(self, fa): # dynamically loaded method of class Screw
     shell = self.RevolveZ(profile)
     solid = Part.Solid(shell)
     # create an additional solid to cut the hex flats with
-    mhex = Base.Matrix()
-    mhex.rotateZ(math.radians(60.0))
-    polygon = []
-    vhex = Base.Vector(s / math.sqrt(3), 0, 0)
-    for i in range(6):
-        polygon.append(vhex)
-        vhex = mhex.multiply(vhex)
-    polygon.append(vhex)
-    hexagon = Part.makePolygon(polygon)
+    hexagon = self.makeHexPolygon(s, 0.0)
     hexFace = Part.Face(hexagon)
     solidHex = hexFace.extrude(Base.Vector(0.0, 0.0, h * 1.1))
     solid = solid.common(solidHex)
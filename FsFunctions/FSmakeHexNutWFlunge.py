@@ -86,15 +86,7 @@ def makeHexNutWFlunge(self, fa): # dynamically loaded method of class Screw
     # Part.show(chamCut)
 
     # create hexagon
-    mhex = Base.Matrix()
-    mhex.rotateZ(math.radians(60.0))
-    polygon = []
-    vhex = Base.Vector(s / math.sqrt(3.0), 0.0, m)
-    for i in range(6):
-        polygon.append(vhex)
-        vhex = mhex.multiply(vhex)
-    polygon.append(vhex)
-    hexagon = Part.makePolygon(polygon)
+    hexagon = self.makeHexPolygon(s, m)
     hexFace = Part.Face(hexagon)
     solidHex = hexFace.extrude(Base.Vector(0.0, 0.0, c - m))
     # Part.show(solidHex)
@@ -74,6 +74,11 @@ class FastenersWorkbench (Workbench):
         "This function is executed when the workbench is activated"
         import FastenerBase
         FastenerBase.InitCheckables()
+        if FastenerBase.FSParam.GetBool("WarmRecessCache", False):
+          # prebuild common recess tools once the workbench is up
+          from PySide import QtCore
+          import screw_maker
+          QtCore.QTimer.singleShot(0, screw_maker.warmRecessCache)
         return
  
     def Deactivated(self):
@@ -450,16 +450,19 @@ class FSScrewMaker(Screw):
 
     def updateFastenerParameters(self):
         global FSParam
-        oldState = str(self.sm3DPrintMode) + str(self.smNutThrScaleA) + str(self.smNutThrScaleB) + str(self.smScrewThrScaleA) + str(self.smScrewThrScaleB)
+        oldState = str(self.sm3DPrintMode) + str(self.smSimpleThread) + str(self.smNutThrScaleA) + str(self.smNutThrScaleB) + str(self.smScrewThrScaleA) + str(self.smScrewThrScaleB)
         self.sm3DPrintMode = False
-        threadMode = FSParam.GetInt("ScrewToolbarThreadGeneration", 0)  # 0 = standard, 1 = 3dprint
+        self.smSimpleThread = False
+        threadMode = FSParam.GetInt("ScrewToolbarThreadGeneration", 0)  # 0 = standard, 1 = 3dprint, 2 = simplified
         if threadMode == 1:
             self.sm3DPrintMode = True
+        elif threadMode == 2:
+            self.smSimpleThread = True
         self.smNutThrScaleA = FSParam.GetFloat("NutThrScaleA", 1.03)
         self.smNutThrScaleB = FSParam.GetFloat("NutThrScaleB", 0.1)
         self.smScrewThrScaleA = FSParam.GetFloat("ScrewThrScaleA", 0.99)
         self.smScrewThrScaleB = FSParam.GetFloat("ScrewThrScaleB", -0.05)
-        newState = str(self.sm3DPrintMode) + str(self.smNutThrScaleA) + str(self.smNutThrScaleB) + str(
+        newState = str(self.sm3DPrintMode) + str(self.smSimpleThread) + str(self.smNutThrScaleA) + str(self.smNutThrScaleB) + str(
             self.smScrewThrScaleA) + str(self.smScrewThrScaleB)
         if oldState != newState:
             FastenerBase.FSCacheRemoveThreaded()  # thread parameters have changed, remove cached ones
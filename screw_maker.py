@@ -87,12 +87,14 @@ __author__ = "Ulrich Brammer <ulrich1a@users.sourceforge.net>"
 
 
 import errno
-import FreeCAD, Part, math, os
+import FreeCAD, Part, math, os, sys
 from FreeCAD import Base
 import DraftVecUtils
 import importlib
+import functools
 import FastenerBase
 from FastenerBase import FsData
+from utils import lenStr2mm
 
 #from FastenersCmd import FastenerAttribs
 
@@ -104,8 +106,89 @@ DEBUG = False # set to True to show debug messages; does not work, still todo.
 # some common constants
 sqrt3 = math.sqrt(3)
 cos30 = math.cos(math.radians(30))
+tan30 = math.tan(math.radians(30))
+# unit direction vectors of a closed hexagon (first vertex repeated at the end)
+_HEX_DIRS = tuple((math.cos(k * math.pi / 3.0), math.sin(k * math.pi / 3.0)) for k in range(7))
+
+# data tables looked up on every call
+_DIALIST = FsData["DiaList"]
+_ISO10664 = FsData["iso10664def"]
+
+# interned type tags for the recess tool cache keys
+_K_ALLEN2 = sys.intern("Allen2Tool")
+_K_HEXLOB = sys.intern("HexalobularTool")
+
+
+def _rotatedHex(x, y, z):
+    # the point (x, y, z) rotated around the z-axis in 6 steps of 60 degrees,
+    # the first point is repeated at the end to close a polygon
+    return [Base.Vector(x * c - y * s, x * s + y * c, z) for c, s in _HEX_DIRS]
+
+
+def _coneArcPoints(width, depth, t):
+    # points for an arc at the peak of the cone of the Allen and hexalobular
+    # recess cutters: cone of the given width and depth with its base at -t
+    # radBeta is the cone flank angle: sin(radBeta) = depth / hyp, cos(radBeta) = width / hyp
+    rCone = width / 4.0
+    hyp = math.hypot(width, depth)
+    radBeta = math.atan2(depth, width)
+    zrConeCenter = hyp / 4.0 - depth - t
+    xArc1 = depth / hyp * rCone
+    zArc1 = zrConeCenter - width / hyp * rCone
+    xArc2 = math.sin(radBeta / 2.0) * rCone
+    zArc2 = zrConeCenter - math.cos(radBeta / 2.0) * rCone
+    zArc3 = zrConeCenter - rCone
+    return xArc1, zArc1, xArc2, zArc2, zArc3
+
+
+# convert a length string to mm, the same few lengths are parsed over and over
+@functools.lru_cache(maxsize=1024)
+def _parseLength(LenStr):
+    return lenStr2mm(LenStr)
+
+
+# thread diameter (string or number) to mm, scaled when printing threads in 3D
+@functools.lru_cache(maxsize=1024)
+def _resolveDia(ThreadDiam, isNut, printMode, nutScaleA, nutScaleB, screwScaleA, screwScaleB):
+    if type(ThreadDiam) == type(""):
+        threadstring = ThreadDiam.strip("()")
+        dia = _DIALIST[threadstring][0]
+    else:
+        dia = ThreadDiam
+    if printMode:
+        if isNut:
+            dia = nutScaleA * dia + nutScaleB
+        else:
+            dia = screwScaleA * dia + screwScaleB
+    return dia
+
+
+# constants used by makeCross_H3
+tan265 = math.tan(math.radians(26.5))
+tan28 = math.tan(math.radians(28.0))
+
+
+def _crossRecessConstants(b, e_mean, g, f_mean, r, t1, alpha, beta):
+    # The angles 92 degrees and alpha are defined on a plane which has
+    # an angle of beta against our coordinate system.
+    # The projected angles are needed for easier calculation!
+    rad_beta = math.radians(beta)
+    rad_alpha_p = math.atan(math.tan(math.radians(alpha / 2.0)) / math.cos(rad_beta))
+    rad92_p = math.atan(math.tan(math.radians(92.0 / 2.0)) / math.cos(rad_beta))
+    return (b, e_mean, g, math.tan(rad_beta), math.tan(rad_alpha_p),
+            math.cos(rad92_p), math.sin(rad92_p))
+
+
+# ISO 4757 cross recess dimensions with their angle dependent values resolved
+_CROSS_CONST = {cT: _crossRecessConstants(*dims) for cT, dims in FsData["iso4757def"].items()}
+
 
 class Screw:
+    # names of the FsFunctions methods already attached to this class
+    _loaded_fns = set()
+    # fastener type -> its FsData dimension table
+    _dim_table_cache = {}
+
     def __init__(self):
         self.objAvailable = True
         self.Tuner = 510
@@ -113,33 +196,40 @@ class Screw:
         # thread scaling for 3D printers
         # scaled_diam = diam * ScaleA + ScaleB
         self.sm3DPrintMode = False
+        # use revolved grooves instead of a helical sweep for screw threads
+        self.smSimpleThread = False
+        # face maker shared by the profile builders below, reset before each use
+        self._fm = FastenerBase.FSFaceMaker()
         self.smNutThrScaleA = 1.0
         self.smNutThrScaleB = 0.0
         self.smScrewThrScaleA = 1.0
         self.smScrewThrScaleB = 0.0
 
     def createScrew(self, function, fastenerAttribs):
-        # self.simpThread = self.SimpleScrew.isChecked()
         # self.symThread = self.SymbolThread.isChecked()
         # FreeCAD.Console.PrintMessage(NL_text + "\n")
         if not self.objAvailable:
             return None
         try:
-            if fastenerAttribs.calc_len is not None:
+            # only convert once, calc_len keeps the number afterwards
+            if isinstance(fastenerAttribs.calc_len, str):
                 fastenerAttribs.calc_len = self.getLength(fastenerAttribs.calc_len)
-            if not hasattr(self, function):
-                module = "FsFunctions.FS" + function
-                setattr(Screw, function, getattr(importlib.import_module(module), function))
-        except ValueError:
+        except (ValueError, ZeroDivisionError):
             # print "Error! nom_dia and length values must be valid numbers!"
             FreeCAD.Console.PrintMessage("Error! nom_dia and length values must be valid numbers!\n")
             return None
+        if function != "" and not self.loadFunction(function):
+            return None
 
 
         if (fastenerAttribs.diameter == "Custom"):
              fastenerAttribs.dimTable = None
         else:
-             fastenerAttribs.dimTable = FsData[fastenerAttribs.type + "def"][fastenerAttribs.diameter]
+             table = Screw._dim_table_cache.get(fastenerAttribs.type)
+             if table is None:
+                 table = FsData[fastenerAttribs.type + "def"]
+                 Screw._dim_table_cache[fastenerAttribs.type] = table
+             fastenerAttribs.dimTable = table[fastenerAttribs.diameter]
         self.leftHanded = fastenerAttribs.leftHanded
         # self.fastenerLen = l
         # fa.type = ST_text
@@ -148,16 +238,26 @@ class Screw:
         # self.customDia = customDia
         doc = FreeCAD.activeDocument()
 
-        if function != "" :
-            function = "self." + function + "(fastenerAttribs)"
-            screw = eval(function)
-            done = True
-        else:
+        fn = getattr(self, function, None) if function != "" else None
+        if fn is None:
             FreeCAD.Console.PrintMessage("No suitable function for " + fastenerAttribs.type + " Screw Type!\n")
             return None
+        screw = fn(fastenerAttribs)
         #Part.show(screw)    
         return screw
-        
+
+    # attach the method making a fastener from its FsFunctions module
+    def loadFunction(self, function):
+        if function not in Screw._loaded_fns:
+            try:
+                module = importlib.import_module("FsFunctions.FS" + function)
+                setattr(Screw, function, getattr(module, function))
+            except (ImportError, AttributeError):
+                FreeCAD.Console.PrintMessage("Error! can not load function " + function + "!\n")
+                return False
+            Screw._loaded_fns.add(function)
+        return True
+
     # DIN 7998 Wood Thread
     # zs: z position of start of the threaded part
     # ze: z position of end of the flat portion of screw (just where the tip starts) 
@@ -166,16 +266,23 @@ class Screw:
     # ri: inner radius
     # p:  thread pitch
     def makeDin7998Thread(self, zs, ze, zt, ri, ro, p):
+        # the thread is built with its tip at z=0 and moved to zt at the end
+        key, res = FastenerBase.FSGetKey("Din7998Thread", ri, ro, p, zs - ze, ze - zt, self.leftHanded)
+        if res is not None:
+            thread_solid = res.copy()
+            thread_solid.translate(FreeCAD.Vector(0.0, 0.0, zt))
+            return thread_solid
         epsilon = 0.03                          # epsilon needed since OCCT struggle to handle overlaps
         tph = ro - ri                           # thread profile height
-        tphb = tph / math.tan(math.radians(60)) # thread profile half base
+        tphb = tph / sqrt3                      # thread profile half base (tan(60) = sqrt3)
         tpratio = 0.5                           # size ratio between tip start thread and standard thread 
         tph2 = tph * tpratio
         tphb2 = tphb * tpratio
         tipH = ze - zt
 
         # tip thread profile
-        fm = FastenerBase.FSFaceMaker()
+        fm = self._fm
+        fm.Reset()
         fm.AddPoints((0.0, -tphb2), (0.0, tphb2), (2.0 * tphb2, tphb2))
         aWire = fm.GetClosedWire()
         aWire.translate(FreeCAD.Vector(epsilon, 0.0, 3.0 * tphb2))
@@ -199,7 +306,6 @@ class Screw:
             sweep.build()
             sweep.makeSolid()
             tip_solid = sweep.shape()
-            tip_solid.translate(FreeCAD.Vector(0.0, 0.0, zt))
             #Part.show(tip_solid)
         else:
             raise RuntimeError("Failed to create woodscrew tip thread")
@@ -215,7 +321,6 @@ class Screw:
             sweep.build()
             sweep.makeSolid()
             body_solid = sweep.shape()
-            body_solid.translate(FreeCAD.Vector(0.0, 0.0, zt))
             #Part.show(body_solid)
         else:
             raise RuntimeError("Failed to create woodscrew body thread")
@@ -224,22 +329,21 @@ class Screw:
         # rotate the thread solid to prevent OCC errors due to cylinder seams aligning
         thread_solid.rotate(Base.Vector(0, 0, 0), Base.Vector(0, 0, 1), 180)
         #Part.show(thread_solid, "thread_solid")
+        FastenerBase.FSCache[key] = thread_solid
+        thread_solid = thread_solid.copy()
+        thread_solid.translate(FreeCAD.Vector(0.0, 0.0, zt))
         return thread_solid
 
 
+    # closed hexagon wire with width across flats s_hex at height z,
+    # first vertex on the x-axis
+    def makeHexPolygon(self, s_hex, z):
+        return Part.makePolygon(_rotatedHex(s_hex / sqrt3, 0.0, z))
+
     def makeHextool(self, s_hex, k_hex, cir_hex):
         # makes a cylinder with an inner hex hole, used as cutting tool
         # create hexagon face
-        mhex = Base.Matrix()
-        mhex.rotateZ(math.radians(60.0))
-        polygon = []
-        vhex = Base.Vector(s_hex / math.sqrt(3.0), 0.0, -k_hex * 0.1)
-        for i in range(6):
-            polygon.append(vhex)
-            vhex = mhex.multiply(vhex)
-        polygon.append(vhex)
-        hexagon = Part.makePolygon(polygon)
-        hexagon = Part.Face(hexagon)
+        hexagon = Part.Face(self.makeHexPolygon(s_hex, -k_hex * 0.1))
 
         # create circle face
         circ = Part.makeCircle(cir_hex / 2.0, Base.Vector(0.0, 0.0, -k_hex * 0.1))
@@ -267,11 +371,13 @@ class Screw:
         helix.translate(FreeCAD.Vector(0.0, 0.0, -P * 9.0 / 16.0))
 
         # points for inner thread profile
-        fm = FastenerBase.FSFaceMaker()
-        fm.AddPoint(r - H * 5.0 / 8.0, P * 7.0 / 16.0)
-        fm.AddPoint(r, P * 2.0 / 16.0)
-        fm.AddArc(r + H * 1 / 24.0, P * 2.0 / 32.0, r, 0)
-        fm.AddPoint(r - H * 5.0 / 8.0, -P * 5.0 / 16.0)
+        fm = self._fm
+        fm.Reset()
+        fm.AddPoints(
+            (r - H * 5.0 / 8.0, P * 7.0 / 16.0),
+            (r, P * 2.0 / 16.0),
+            (r + H * 1 / 24.0, P * 2.0 / 32.0, r, 0),
+            (r - H * 5.0 / 8.0, -P * 5.0 / 16.0))
         W0 = fm.GetClosedWire()
         W0.translate(Base.Vector(0,0,-P))
 
@@ -282,32 +388,39 @@ class Screw:
         return cutTool
 
     def CreateThreadCutter(self, dia, P, blen):
+        if self.smSimpleThread:
+            return self.makeSimpleThreadCutter(dia, P, blen)
         # make a cylindrical solid, then cut the thread profile from it
-        H = math.sqrt(3) / 2 * P
+        H = P * cos30  # Thread depth H
         # move the very bottom of the base up a tiny amount
         # prevents some too-small edges from being created
         trotations = blen // P + 1
 
         # create a sketch profile of the thread
         # ref: https://en.wikipedia.org/wiki/ISO_metric_screw_thread
-        fillet_r = P * math.sqrt(3) / 12
+        fillet_r = P * sqrt3 / 12
         helix_height = trotations * P
         dia2 = dia / 2
  
-        fm = FastenerBase.FSFaceMaker()
-        fm.AddPoint(dia2 + sqrt3 * 3 / 80 * P, -0.475 * P)
-        fm.AddPoint(dia2 - 0.625 * H, -1 * P / 8)
-        fm.AddArc(dia2 - 0.625 * H - 0.5 * fillet_r, 0, dia2 - 0.625 * H, P / 8)
-        fm.AddPoint(dia2 + sqrt3 * 3 / 80 * P, 0.475 * P)
+        fm = self._fm
+        fm.Reset()
+        fm.AddPoints(
+            (dia2 + sqrt3 * 3 / 80 * P, -0.475 * P),
+            (dia2 - 0.625 * H, -1 * P / 8),
+            (dia2 - 0.625 * H - 0.5 * fillet_r, 0, dia2 - 0.625 * H, P / 8),
+            (dia2 + sqrt3 * 3 / 80 * P, 0.475 * P))
         thread_profile_wire = fm.GetClosedWire()
         thread_profile_wire.translate(Base.Vector(0, 0, -1 * helix_height))
         # make the helical paths to sweep along
         # NOTE: makeLongHelix creates slightly conical
         # helices unless the 4th parameter is set to 0!
+        # makeLongHelix already builds the path from one edge per turn, so
+        # long threads do not need to be split into separately swept segments
         main_helix = Part.makeLongHelix(P, helix_height, dia / 2, 0, self.leftHanded)
         lead_out_helix = Part.makeLongHelix(P, P / 2, dia / 2 + 0.5 * (5 / 8 * H + 0.5 * fillet_r), 0, self.leftHanded)
-        main_helix.rotate(Base.Vector(0, 0, 0), Base.Vector(1, 0, 0), 180)
-        lead_out_helix.translate(Base.Vector(0.5 * (-1 * (5 / 8 * H + 0.5 * fillet_r)), 0, 0))
+        # the helices are freshly made, so their placements can be set directly
+        main_helix.Placement = FreeCAD.Placement(Base.Vector(0, 0, 0), FreeCAD.Rotation(Base.Vector(1, 0, 0), 180))
+        lead_out_helix.Placement = FreeCAD.Placement(Base.Vector(0.5 * (-1 * (5 / 8 * H + 0.5 * fillet_r)), 0, 0), FreeCAD.Rotation())
         sweep_path = Part.Wire([main_helix, lead_out_helix])
         # use Part.BrepOffsetAPI to sweep the thread profile
         # ref: https://forum.freecadweb.org/viewtopic.php?t=21636#p168339
@@ -323,8 +436,39 @@ class Screw:
         sweep.makeSolid()
         return sweep.shape()
 
+    def makeSimpleThreadCutter(self, dia, P, blen):
+        """
+        Simplified version of the CreateThreadCutter tool: one revolved
+        60 degree ring per pitch over the same z-range as the helical
+        sweep, so no sweep is needed. The groove root is left flat.
+        """
+        H = P * cos30  # Thread depth H
+        dia2 = dia / 2
+        ro = dia2 + sqrt3 * 3 / 80 * P  # outer radius of the cutter profile
+        ri = dia2 - 0.625 * H  # radius of the groove root
+        trotations = int(blen // P) + 1
+        pnts = [(ro, 0.475 * P)]
+        for k in range(trotations + 1):
+            zc = -k * P
+            pnts.extend(((ri, zc + P / 8), (ri, zc - P / 8), (ro, zc - 0.475 * P)))
+            if k < trotations:
+                pnts.append((ro, zc - P + 0.475 * P))
+        # close the profile outside the rings
+        pnts.extend(((ro + P, -trotations * P - 0.475 * P), (ro + P, 0.475 * P)))
+        fm = self._fm
+        fm.Reset()
+        fm.AddPoints(*pnts)
+        return self.RevolveZ(fm.GetFace())
+
     def RevolveZ(self, profile, angle = 360):
         return profile.revolve(Base.Vector(0, 0, 0), Base.Vector(0, 0, 1), angle)
+
+    def isPlaneAtZ(self, face, z, tol = 1e-7):
+        # check if face is planar and lies in the horizontal plane at height z
+        surf = face.Surface
+        if not isinstance(surf, Part.Plane):
+            return False
+        return abs(abs(surf.Axis.z) - 1.0) < tol and abs(surf.Position.z - z) < tol
         
     def makeShellthread(self, dia, P, blen, withcham, ztop, tlen = -1):
         """
@@ -339,6 +483,18 @@ class Screw:
         correction = 1e-5
         if tlen < 0:
             tlen = blen
+        key, res = FastenerBase.FSGetKey("ShellThread", dia, P, blen, withcham, tlen, self.leftHanded,
+                                         self.smSimpleThread)
+        if res is not None:
+            result = res.copy()
+            result.translate(Base.Vector(0, 0, ztop))
+            return result
+        if self.smSimpleThread:
+            result = self.makeSimpleShellthread(dia, P, blen, withcham, tlen)
+            FastenerBase.FSCache[key] = result
+            result = result.copy()
+            result.translate(Base.Vector(0, 0, ztop))
+            return result
         dia2 = dia / 2
         corr_blen = blen - correction
         
@@ -349,14 +505,10 @@ class Screw:
         pnt3 = (0, -corr_blen)
         pnt4 = (0, 0)
         pnt5 = (dia2, -corr_blen)
-        fm = FastenerBase.FSFaceMaker()
-        fm.AddPoints(pnt0)
-        if withcham:
-            fm.AddPoints(pnt1, pnt2)
-        else:
-            fm.AddPoints(pnt5)
-        fm.AddPoints(pnt3, pnt4)
-
+        pnts = (pnt0, pnt1, pnt2, pnt3, pnt4) if withcham else (pnt0, pnt5, pnt3, pnt4)
+        fm = self._fm
+        fm.Reset()
+        fm.AddPoints(*pnts)
         base_profile = fm.GetClosedWire()
         base_shell = self.RevolveZ(base_profile)
         base_body = Part.makeSolid(base_shell)
@@ -383,23 +535,59 @@ class Screw:
             # threaded_solid = threaded_solid.fuse(cap_solid)
             # threaded_solid.removeSplitter
         # remove top face(s) and convert to a shell
+        # the top faces are the planar ones lying in the z=0 plane, this is
+        # cheaper to check on the surface than integrating each CenterOfMass
         result = Part.Shell([x for x in threaded_solid.Faces \
-                             if not abs(x.CenterOfMass[2]) < 1e-7])
+                             if not self.isPlaneAtZ(x, 0.0)])
+        FastenerBase.FSCache[key] = result
+        result = result.copy()
         result.translate(Base.Vector(0, 0, ztop))
         return result
 
-    # if da is not None: make Shell for a nut else: make a screw tap
-    def makeInnerThread_2(self, d, P, rotations, da, l):
-        d = float(d)
-        bot_off = 0.0  # nominal length
-
-        # if d > 52.0:
-        #     fuzzyValue = 5e-5
-        # else:
-        #     fuzzyValue = 0.0
+    def makeSimpleShellthread(self, dia, P, blen, withcham, tlen):
+        """
+        Construct a simplified version of the makeShellthread shell.
+        The thread is represented by revolved 60 degree grooves, one per
+        pitch, so no helical sweep and no boolean operation is needed.
+        The shell is constructed z-up with the top circular face removed
+        and its top centered @ (0, 0, 0)
+        """
+        correction = 1e-5
+        dia2 = dia / 2
+        corr_blen = blen - correction
+        depth = P * cos30 * 5.0 / 8.0
+        # the thread starts at the same height as the swept one of makeShellthread
+        z = -max(blen - tlen + P / 2, 5 * P / 8)
+        if withcham:
+            zbot = -blen + P / 2
+        else:
+            zbot = -corr_blen
+
+        pnts = [(dia2, 0)]
+        if z > zbot:
+            pnts.append((dia2, z))
+            while z - P > zbot + correction:
+                pnts.extend(((dia2 - depth, z - P * 5.0 / 16.0),
+                             (dia2, z - P * 5.0 / 8.0),
+                             (dia2, z - P)))
+                z -= P
+        if withcham:
+            pnts.extend(((dia2, zbot), (dia2 - P / 2, -corr_blen)))
+        else:
+            pnts.append((dia2, -corr_blen))
+        pnts.append((0, -corr_blen))
 
-        fuzzyValue = 5e-4
+        fm = self._fm
+        fm.Reset()
+        fm.AddPoints(*pnts)
+        # revolving the open profile leaves out the top face
+        return Part.Shell(self.RevolveZ(fm.GetWire()).Faces)
 
+    # one turn of the inner thread shell used by makeInnerThread_2
+    def makeInnerThreadTurn(self, d, P):
+        key, res = FastenerBase.FSGetKey("InnerThreadTurn", d, P, self.leftHanded, self.Tuner)
+        if res is not None:
+            return res.copy()
         H = P * cos30  # Thread depth H
         r = d / 2.0
 
@@ -407,12 +595,14 @@ class Screw:
         helix.translate(FreeCAD.Vector(0.0, 0.0, -P * 9.0 / 16.0))
 
         # points for inner thread profile
-        fm = FastenerBase.FSFaceMaker()
-        fm.AddPoint(r, 0.0)
-        fm.AddPoint(r - H * 5.0 / 8.0, -P * 5.0 / 16.0)
-        fm.AddPoint(r - H * 5.0 / 8.0, -P * 9.0 / 16.0)
-        fm.AddPoint(r, -P * 14.0 / 16.0)
-        fm.AddArc(r + H * 1 / 24.0, -P * 31.0 / 32.0, r, -P)
+        fm = self._fm
+        fm.Reset()
+        fm.AddPoints(
+            (r, 0.0),
+            (r - H * 5.0 / 8.0, -P * 5.0 / 16.0),
+            (r - H * 5.0 / 8.0, -P * 9.0 / 16.0),
+            (r, -P * 14.0 / 16.0),
+            (r + H * 1 / 24.0, -P * 31.0 / 32.0, r, -P))
         W0 = fm.GetWire()
         # Part.show(W0, 'W0')
         # self.CreateInnerThreadCutter(d, P, 5 * P)
@@ -420,19 +610,39 @@ class Screw:
         makeSolid = False
         isFrenet = True
         TheShell = Part.Wire(helix).makePipeShell([W0], makeSolid, isFrenet)
+        # makeInnerThread_2 moves the shell turn by turn, so hand out copies
+        FastenerBase.FSCache[key] = TheShell
+        return TheShell.copy()
+
+    # if da is not None: make Shell for a nut else: make a screw tap
+    def makeInnerThread_2(self, d, P, rotations, da, l):
+        d = float(d)
+        bot_off = 0.0  # nominal length
+
+        # if d > 52.0:
+        #     fuzzyValue = 5e-5
+        # else:
+        #     fuzzyValue = 0.0
+
+        fuzzyValue = 5e-4
+
+        H = P * cos30  # Thread depth H
+
+        TheShell = self.makeInnerThreadTurn(d, P)
         TheFaces = TheShell.Faces
 
         if da is None:
             commonbox = Part.makeBox(d + 4.0 * P, d + 4.0 * P, 3.0 * P)
             commonbox.translate(FreeCAD.Vector(-(d + 4.0 * P) / 2.0, -(d + 4.0 * P) / 2.0, -(3.0) * P))
             topShell = TheShell.common(commonbox)
-            top_edges = []
             top_z = -1.0e-5
 
+            top_edges = []
             for kante in topShell.Edges:
-                if kante.Vertexes[0].Point.z >= top_z and kante.Vertexes[1].Point.z >= top_z:
+                # fetch the vertex list only once, skip the second vertex if the first fails
+                v0, v1 = kante.Vertexes
+                if v0.Point.z >= top_z and v1.Point.z >= top_z:
                     top_edges.append(kante)
-                    # Part.show(kante)
             top_wire = Part.Wire(Part.__sortEdges__(top_edges))
             top_face = Part.Face(top_wire)
 
@@ -441,17 +651,14 @@ class Screw:
 
             for i in range(rotations - 2):
                 TheShell.translate(FreeCAD.Vector(0.0, 0.0, - P))
-                for flaeche in TheShell.Faces:
-                    TheFaces.append(flaeche)
+                TheFaces.extend(TheShell.Faces)
 
             # FreeCAD.Console.PrintMessage("Base-Shell: " + str(i) + "\n")
             # Make separate faces for the tip of the screw
             botFaces = []
             for i in range(rotations - 2, rotations, 1):
                 TheShell.translate(FreeCAD.Vector(0.0, 0.0, - P))
-
-                for flaeche in TheShell.Faces:
-                    botFaces.append(flaeche)
+                botFaces.extend(TheShell.Faces)
             # FreeCAD.Console.PrintMessage("Bottom-Shell: " + str(i) + "\n")
             # FreeCAD.Console.PrintMessage("without chamfer: " + str(i) + "\n")
 
@@ -465,20 +672,19 @@ class Screw:
 
             BotShell = BotShell.common(commonbox)
             # BotShell = BotShell.cut(commonbox)
-            bot_edges = []
             bot_z = 1.0e-5 - (rotations) * P + bot_off
 
+            bot_edges = []
             for kante in BotShell.Edges:
-                if kante.Vertexes[0].Point.z <= bot_z and kante.Vertexes[1].Point.z <= bot_z:
+                v0, v1 = kante.Vertexes
+                if v0.Point.z <= bot_z and v1.Point.z <= bot_z:
                     bot_edges.append(kante)
-                    # Part.show(kante)
             bot_wire = Part.Wire(Part.__sortEdges__(bot_edges))
 
             bot_face = Part.Face(bot_wire)
             bot_face.reverse()
 
-            for flaeche in BotShell.Faces:
-                TheFaces.append(flaeche)
+            TheFaces.extend(BotShell.Faces)
             # if da is not None:
             # for flaeche in cham_Shell.Faces:
             # TheFaces.append(flaeche)
@@ -494,12 +700,14 @@ class Screw:
             cham_i = 2 * H * math.tan(math.radians(15.0))  # inner chamfer
 
             # points for chamfer: cut-Method
-            fm = FastenerBase.FSFaceMaker()
+            fm = self._fm
+            fm.Reset()
             da2 = da / 2.0
-            fm.AddPoint(da2 - 2 * H, +cham_i)
-            fm.AddPoint(da2, 0.0)
-            fm.AddPoint(da2, - 2.1 * P)
-            fm.AddPoint(da2 - 2 * H, - 2.1 * P)
+            fm.AddPoints(
+                (da2 - 2 * H, +cham_i),
+                (da2, 0.0),
+                (da2, - 2.1 * P),
+                (da2 - 2 * H, - 2.1 * P))
             bottom_Face = fm.GetFace()
             bottom_Solid = self.RevolveZ(bottom_Face)
             # Part.show(cham_Solid, 'cham_Solid')
@@ -507,10 +715,12 @@ class Screw:
             bottomChamferFace = bottom_Solid.Faces[0]
 
             # points for chamfer: cut-Method
-            fm.StartPoint(da / 2.0 - 2 * H, l - cham_i)
-            fm.AddPoint(da / 2.0, l)
-            fm.AddPoint(da / 2.0, l + 4 * P)
-            fm.AddPoint(da / 2.0 - 2 * H, l + 4 * P)
+            fm.Reset()
+            fm.AddPoints(
+                (da2 - 2 * H, l - cham_i),
+                (da2, l),
+                (da2, l + 4 * P),
+                (da2 - 2 * H, l + 4 * P))
             top_Face = fm.GetFace()
 
             top_Solid = self.RevolveZ(top_Face)
@@ -520,10 +730,8 @@ class Screw:
 
             threeThreadFaces = TheFaces.copy()
 
-            for k in range(1):
-                TheShell.translate(FreeCAD.Vector(0.0, 0.0, P))
-                for threadFace in TheShell.Faces:
-                    threeThreadFaces.append(threadFace)
+            TheShell.translate(FreeCAD.Vector(0.0, 0.0, P))
+            threeThreadFaces.extend(TheShell.Faces)
 
             chamferShell = Part.Shell(threeThreadFaces)
             # Part.show(chamferShell, 'chamferShell')
@@ -542,16 +750,14 @@ class Screw:
             if len(bottomMap[0]) < 2:
                 return None
             innerThreadFaces = [bottomMap[0][1]]
-            for face in bottomPart.Faces:
-                innerThreadFaces.append(face)
+            innerThreadFaces.extend(bottomPart.Faces)
             # bottomShell = Part.Shell(innerThreadFaces)
             # Part.show(bottomShell)
             bottomFaces = []
             # TheShell.translate(FreeCAD.Vector(0.0, 0.0, P))
             for k in range(1, rotations - 2):
                 TheShell.translate(FreeCAD.Vector(0.0, 0.0, P))
-                for threadFace in TheShell.Faces:
-                    innerThreadFaces.append(threadFace)
+                innerThreadFaces.extend(TheShell.Faces)
             testShell = Part.Shell(innerThreadFaces)
             # Part.show(testShell, 'testShell')
 
@@ -564,8 +770,7 @@ class Screw:
                 # cut operation failed
                 return None
             # Part.show(topPart, 'topPart')
-            for face in topPart.Faces:
-                innerThreadFaces.append(face)
+            innerThreadFaces.extend(topPart.Faces)
 
             topFuse, topMap = topChamferFace.generalFuse([chamferShell], fuzzyValue)
             # print ('topMap: ', topMap)
@@ -596,14 +801,16 @@ class Screw:
         if res is not None:
             return res
         # FastenerBase.FSCache[key] = cyl
-        cham_t = P_cC * sqrt3 / 2.0 * 17.0 / 24.0
+        cham_t = P_cC * cos30 * 17.0 / 24.0
         dia_cC2 = dia_cC / 2.0
-        fm = FastenerBase.FSFaceMaker()
-        fm.AddPoint(0.0, -l_cC)
-        fm.AddPoint(dia_cC2 - cham_t, -l_cC)
-        fm.AddPoint(dia_cC2 + cham_t, -l_cC + cham_t + cham_t)
-        fm.AddPoint(dia_cC2 + cham_t, -l_cC - P_cC - cham_t)
-        fm.AddPoint(0.0, -l_cC - P_cC - cham_t)
+        fm = self._fm
+        fm.Reset()
+        fm.AddPoints(
+            (0.0, -l_cC),
+            (dia_cC2 - cham_t, -l_cC),
+            (dia_cC2 + cham_t, -l_cC + cham_t + cham_t),
+            (dia_cC2 + cham_t, -l_cC - P_cC - cham_t),
+            (0.0, -l_cC - P_cC - cham_t))
 
         CFace = fm.GetFace()
         cyl = self.RevolveZ(CFace)
@@ -612,23 +819,25 @@ class Screw:
 
     # cross recess type H
     def makeCross_H3(self, CrossType='2', m=6.9, h=0.0):
-        key, res = FastenerBase.FSGetKey("CrossRecess", CrossType, m, h)
+        # round the dimension to fold floating point noise into one cache entry,
+        # h only moves the tool, so it is not part of the cache key
+        m = round(m, 4)
+        key, res = FastenerBase.FSGetKey("CrossRecess", CrossType, m)
         if res is not None:
-            return res
+            return self.placeRecessTool(res, h)
         # m = diameter of cross at top of screw at reference level for penetration depth
-        b, e_mean, g, f_mean, r, t1, alpha, beta = FsData["iso4757def"][CrossType]
+        b, e_mean, g, tan_beta, tan_alpha_p, cos92_p, sin92_p = _CROSS_CONST[CrossType]
 
-        rad265 = math.radians(26.5)
-        rad28 = math.radians(28.0)
-        tg = (m - g) / 2.0 / math.tan(rad265)  # depth at radius of g
-        t_tot = tg + g / 2.0 * math.tan(rad28)  # total depth
+        tg = (m - g) / 2.0 / tan265  # depth at radius of g
+        t_tot = tg + g / 2.0 * tan28  # total depth
 
         # print 'tg: ', tg,' t_tot: ', t_tot
         hm = m / 4.0
         hmc = m / 2.0
-        rmax = m / 2.0 + hm * math.tan(rad265)
+        rmax = m / 2.0 + hm * tan265
 
-        fm = FastenerBase.FSFaceMaker()
+        fm = self._fm
+        fm.Reset()
         fm.AddPoints((0.0, hm), (rmax, hm), (g / 2.0, -tg), (0.0, -t_tot))
         aWire = fm.GetWire()
         crossShell = self.RevolveZ(aWire)
@@ -637,33 +846,28 @@ class Screw:
         # Part.show(cross)
 
         # the need to cut 4 corners out of the above shape.
-        # Definition of corner
-        # The angles 92 degrees and alpha are defined on a plane which has
-        # an angle of beta against our coordinate system.
-        # The projected angles are needed for easier calculation!
-        rad_alpha = math.radians(alpha / 2.0)
-        rad92 = math.radians(92.0 / 2.0)
-        rad_beta = math.radians(beta)
-
-        rad_alpha_p = math.atan(math.tan(rad_alpha) / math.cos(rad_beta))
-        rad92_p = math.atan(math.tan(rad92) / math.cos(rad_beta))
-
-        tb = tg + (g - b) / 2.0 * math.tan(rad28)  # depth at dimension b
-        rbtop = b / 2.0 + (hmc + tb) * math.tan(rad_beta)  # radius of b-corner at hm
-        rbtot = b / 2.0 - (t_tot - tb) * math.tan(rad_beta)  # radius of b-corner at t_tot
-
-        dre = e_mean / 2.0 / math.tan(rad_alpha_p)  # delta between corner b and corner e in x direction
+        # Definition of corner, see _crossRecessConstants
+        tb = tg + (g - b) / 2.0 * tan28  # depth at dimension b
+        rbtop = b / 2.0 + (hmc + tb) * tan_beta  # radius of b-corner at hm
+        rbtot = b / 2.0 - (t_tot - tb) * tan_beta  # radius of b-corner at t_tot
+
+        dre = e_mean / 2.0 / tan_alpha_p  # delta between corner b and corner e in x direction
         # FreeCAD.Console.PrintMessage("delta calculated: " + str(dre) + "\n")
 
-        dx = m / 2.0 * math.cos(rad92_p)
-        dy = m / 2.0 * math.sin(rad92_p)
+        dx = m / 2.0 * cos92_p
+        dy = m / 2.0 * sin92_p
+
+        x_e = rbtot + dre  # x of the e-corners
+        x_o = x_e + 2.0 * dx  # x of the outer corners
+        y_e = e_mean / 2.0
+        y_o = e_mean + 2.0 * dy
 
         PntC0 = Base.Vector(rbtop, 0.0, hmc)
         PntC1 = Base.Vector(rbtot, 0.0, -t_tot)
-        PntC3 = Base.Vector(rbtot + dre, +e_mean / 2.0, -t_tot)
-        PntC5 = Base.Vector(rbtot + dre, -e_mean / 2.0, -t_tot)
-        PntC7 = Base.Vector(rbtot + dre + 2.0 * dx, +e_mean + 2.0 * dy, -t_tot)
-        PntC9 = Base.Vector(rbtot + dre + 2.0 * dx, -e_mean - 2.0 * dy, -t_tot)
+        PntC3 = Base.Vector(x_e, +y_e, -t_tot)
+        PntC5 = Base.Vector(x_e, -y_e, -t_tot)
+        PntC7 = Base.Vector(x_o, +y_o, -t_tot)
+        PntC9 = Base.Vector(x_o, -y_o, -t_tot)
 
         wire_t_tot = Part.makePolygon([PntC1, PntC3, PntC7, PntC9, PntC5, PntC1])
         # Part.show(wire_t_tot)
@@ -675,14 +879,8 @@ class Screw:
         corner = Part.Wire(edgeC1).makePipeShell([wire_t_tot], makeSolid, isFrenet)
         # Part.show(corner)
 
-        rot_axis = Base.Vector(0., 0., 1.0)
-        sin_res = math.sin(math.radians(90) / 2.0)
-        cos_res = math.cos(math.radians(90) / 2.0)
-        rot_axis.multiply(-sin_res)  # Calculation of Quaternion-Elements
-        # FreeCAD.Console.PrintMessage("Quaternion-Elements" + str(cos_res) + "\n")
-
-        pl_rot = FreeCAD.Placement()
-        pl_rot.Rotation = (rot_axis.x, rot_axis.y, rot_axis.z, cos_res)  # Rotation-Quaternion 90° z-Axis
+        # the other three corners are rotated in steps of 90 degrees around the z-axis
+        rotations = [FreeCAD.Rotation(Base.Vector(0.0, 0.0, 1.0), -90.0 * k) for k in range(1, 4)]
 
         crossShell = crossShell.cut(corner)
         # Part.show(crossShell)
@@ -700,12 +898,10 @@ class Screw:
 
         crossFaces = cornerShell.Faces
 
-        for i in range(3):
-            cutplace.Rotation = pl_rot.Rotation.multiply(corner.Placement.Rotation)
-            corner.Placement = cutplace
+        for rot in rotations:
+            corner.Placement = FreeCAD.Placement(cutplace.Base, rot)
             crossShell = crossShell.cut(corner)
-            addPlace.Rotation = pl_rot.Rotation.multiply(cornerShell.Placement.Rotation)
-            cornerShell.Placement = addPlace
+            cornerShell.Placement = FreeCAD.Placement(addPlace.Base, rot)
             for coFace in cornerShell.Faces:
                 crossFaces.append(coFace)
 
@@ -720,14 +916,10 @@ class Screw:
 
         cross = Part.Solid(crossShell)
 
-        # FreeCAD.Console.PrintMessage("Placement: " + str(pl_rot) + "\n")
-
-        cross.Placement.Base = Base.Vector(0.0, 0.0, h)
-        crossShell0.Placement.Base = Base.Vector(0.0, 0.0, h)
         # Part.show(crossShell0)
         # Part.show(cross)
         FastenerBase.FSCache[key] = (cross, crossShell0)
-        return cross, crossShell0
+        return self.placeRecessTool((cross, crossShell0), h)
 
     # Allen recess cutting tool
     # Parameters used: s_mean, k, t_min, dk
@@ -737,157 +929,118 @@ class Screw:
         # t_a dept of the allen
         # t_2 depth of center-bore
 
-        key, res = FastenerBase.FSGetKey("Allen2Tool", s_a, t_a, h_a, t_2)
+        # round the dimensions to fold floating point noise into one cache entry,
+        # h_a only moves the tool, so it is not part of the cache key
+        s_a = round(s_a, 4)
+        t_a = round(t_a, 4)
+        t_2 = round(t_2, 4)
+        key, res = FastenerBase.FSGetKey(_K_ALLEN2, s_a, t_a, t_2)
         if res is not None:
-            # reset placement should original objects were moved
-            res[0].Placement = FreeCAD.Placement(FreeCAD.Vector(0,0,h_a),FreeCAD.Rotation(0,0,0,1))
-            res[1].Placement = FreeCAD.Placement(FreeCAD.Vector(0,0,h_a),FreeCAD.Rotation(0,0,0,1))
-            return res
+            return self.placeRecessTool(res, h_a)
 
-        fm = FastenerBase.FSFaceMaker()
+        fm = self._fm
+        fm.Reset()
         if t_2 == 0.0:
             depth = s_a / 3.0
-            e_cham = 2.0 * s_a / math.sqrt(3.0)
+            e_cham = 2.0 * s_a / sqrt3
             # FreeCAD.Console.PrintMessage("allen tool: " + str(s_a) + "\n")
 
             # Points for an arc at the peak of the cone
-            rCone = e_cham / 4.0
-            hyp = (depth * math.sqrt(e_cham ** 2 / depth ** 2 + 1.0) * rCone) / e_cham
-            radAlpha = math.atan(e_cham / depth)
-            radBeta = math.pi / 2.0 - radAlpha
-            zrConeCenter = hyp - depth - t_a
-            xArc1 = math.sin(radBeta) * rCone
-            zArc1 = zrConeCenter - math.cos(radBeta) * rCone
-            xArc2 = math.sin(radBeta / 2.0) * rCone
-            zArc2 = zrConeCenter - math.cos(radBeta / 2.0) * rCone
-            zArc3 = zrConeCenter - rCone
+            xArc1, zArc1, xArc2, zArc2, zArc3 = _coneArcPoints(e_cham, depth, t_a)
 
             # The round part of the cutting tool, we need for the allen hex recess
-            fm.AddPoint(0.0, -t_a - depth - depth)
-            fm.AddPoint(e_cham, -t_a - depth - depth)
-            fm.AddPoint(e_cham, -t_a + depth)
-            fm.AddPoint(xArc1, zArc1)
-            fm.AddArc(xArc2, zArc2, 0.0, zArc3) 
+            fm.AddPoints(
+                (0.0, -t_a - depth - depth),
+                (e_cham, -t_a - depth - depth),
+                (e_cham, -t_a + depth),
+                (xArc1, zArc1),
+                (xArc2, zArc2, 0.0, zArc3))
             hex_depth = -1.0 - t_a - depth * 1.1
         else:
-            e_cham = 2.0 * s_a / math.sqrt(3.0)
+            e_cham = 2.0 * s_a / sqrt3
             d_cent = s_a / 3.0
-            depth_cent = d_cent * math.tan(math.pi / 6.0)
-            depth_cham = (e_cham - d_cent) * math.tan(math.pi / 6.0)
-
-            fm.AddPoint(0.0, -t_2 - depth_cent)
-            fm.AddPoint(0.0, -t_2 - depth_cent - depth_cent)
-            fm.AddPoint(e_cham, -t_2 - depth_cent - depth_cent)
-            fm.AddPoint(e_cham, -t_a + depth_cham)
-            fm.AddPoint(d_cent, -t_a)
-            fm.AddPoint(d_cent, -t_2)
+            depth_cent = d_cent * tan30
+            depth_cham = (e_cham - d_cent) * tan30
+
+            fm.AddPoints(
+                (0.0, -t_2 - depth_cent),
+                (0.0, -t_2 - depth_cent - depth_cent),
+                (e_cham, -t_2 - depth_cent - depth_cent),
+                (e_cham, -t_a + depth_cham),
+                (d_cent, -t_a),
+                (d_cent, -t_2))
             hex_depth = -1.0 - t_2 - depth_cent * 1.1
 
         hFace = fm.GetFace()
         roundtool = self.RevolveZ(hFace)
 
         # create hexagon
-        mhex = Base.Matrix()
-        mhex.rotateZ(math.radians(60.0))
-        polygon = []
-        vhex = Base.Vector(s_a / math.sqrt(3.0), 0.0, 1.0)
-        for i in range(6):
-            polygon.append(vhex)
-            vhex = mhex.multiply(vhex)
-        polygon.append(vhex)
-        hexagon = Part.makePolygon(polygon)
+        hexagon = self.makeHexPolygon(s_a, 1.0)
         hexFace = Part.Face(hexagon)
         solidHex = hexFace.extrude(Base.Vector(0.0, 0.0, hex_depth))
         allen = solidHex.cut(roundtool)
         # Part.show(allen)
 
-        allenFaces = [allen.Faces[0]]
-        for i in range(2, len(allen.Faces)):
-            allenFaces.append(allen.Faces[i])
+        faces = allen.Faces
+        allenFaces = [faces[0]] + faces[2:]
         allenShell = Part.Shell(allenFaces)
-        solidHex.Placement.Base = Base.Vector(0.0, 0.0, h_a)
-        allenShell.Placement.Base = Base.Vector(0.0, 0.0, h_a)
 
         FastenerBase.FSCache[key] = (solidHex, allenShell)
-        return solidHex, allenShell
+        return self.placeRecessTool((solidHex, allenShell), h_a)
 
     # ISO 10664 Hexalobular internal driving feature for bolts and screws
     def makeIso10664_3(self, RType='T20', t_hl=3.0, h_hl=0):
         # t_hl depth of the recess
         # h_hl top height location of Cutting tool
 
-        key, res = FastenerBase.FSGetKey("HexalobularTool", RType, t_hl, h_hl)
+        # round the depth to fold floating point noise into one cache entry,
+        # h_hl only moves the tool, so it is not part of the cache key
+        t_hl = round(t_hl, 4)
+        key, res = FastenerBase.FSGetKey(_K_HEXLOB, RType, t_hl)
         if res is not None:
-            return res
+            return self.placeRecessTool(res, h_hl)
 
-        A, B, Re = FsData["iso10664def"][RType]
-        sqrt_3 = math.sqrt(3.0)
+        A, B, Re = _ISO10664[RType]
         depth = A / 4.0
         offSet = 1.0
 
 
         # Chamfer cutter for the hexalobular recess
         # Points for an arc at the peak of the cone
-        rCone = A / 4.0
-        hyp = (depth * math.sqrt(A ** 2 / depth ** 2 + 1.0) * rCone) / A
-        radAlpha = math.atan(A / depth)
-        radBeta = math.pi / 2.0 - radAlpha
-        zrConeCenter = hyp - depth - t_hl
-        xArc1 = math.sin(radBeta) * rCone
-        zArc1 = zrConeCenter - math.cos(radBeta) * rCone
-        xArc2 = math.sin(radBeta / 2.0) * rCone
-        zArc2 = zrConeCenter - math.cos(radBeta / 2.0) * rCone
-        zArc3 = zrConeCenter - rCone
-
-        fm = FastenerBase.FSFaceMaker()
-        fm.AddPoint(0.0, -t_hl - depth - 1.0)
-        fm.AddPoint(A, -t_hl - depth - 1.0)
-        fm.AddPoint(A, -t_hl + depth)
-        fm.AddPoint(xArc1, zArc1)
-        fm.AddArc(xArc2, zArc2, 0.0, zArc3)
+        xArc1, zArc1, xArc2, zArc2, zArc3 = _coneArcPoints(A, depth, t_hl)
+
+        fm = self._fm
+        fm.Reset()
+        fm.AddPoints(
+            (0.0, -t_hl - depth - 1.0),
+            (A, -t_hl - depth - 1.0),
+            (A, -t_hl + depth),
+            (xArc1, zArc1),
+            (xArc2, zArc2, 0.0, zArc3))
 
         hFace = fm.GetFace()
         cutTool = self.RevolveZ(hFace)
 
-        Ri = -((B + sqrt_3 * (2. * Re - A)) * B + (A - 4. * Re) * A) / (4. * B - 2. * sqrt_3 * A + (4. * sqrt_3 - 8.) * Re)
+        Ri = -((B + sqrt3 * (2. * Re - A)) * B + (A - 4. * Re) * A) / (4. * B - 2. * sqrt3 * A + (4. * sqrt3 - 8.) * Re)
         # print '2nd  Ri last solution: ', Ri
         beta = math.acos(A / (4 * Ri + 4 * Re) - (2 * Re) / (4 * Ri + 4 * Re)) - math.pi / 6
         # print 'beta: ', beta
-        Rh = (sqrt_3 * (A / 2.0 - Re)) / 2.0
+        Rh = (sqrt3 * (A / 2.0 - Re)) / 2.0
         Re_x = A / 2.0 - Re + Re * math.sin(beta)
         Re_y = Re * math.cos(beta)
         Ri_y = B / 4.0
-        Ri_x = sqrt_3 * B / 4.0
-
-        mhex = Base.Matrix()
-        mhex.rotateZ(math.radians(60.0))
+        Ri_x = sqrt3 * B / 4.0
+
+        # the six lobes: an outer arc around Re followed by an inner arc around Ri,
+        # all points rotated in steps of 60 degrees in a single pass
+        PntRe0 = _rotatedHex(Re_x, -Re_y, offSet)
+        PntRe1 = _rotatedHex(A / 2.0, 0.0, offSet)
+        PntRe2 = _rotatedHex(Re_x, Re_y, offSet)
+        PntRi = _rotatedHex(Ri_x, Ri_y, offSet)
         hexlobWireList = []
-
-        PntRe0 = Base.Vector(Re_x, -Re_y, offSet)
-        PntRe1 = Base.Vector(A / 2.0, 0.0, offSet)
-        PntRe2 = Base.Vector(Re_x, Re_y, offSet)
-        edge0 = Part.Arc(PntRe0, PntRe1, PntRe2).toShape()
-        # Part.show(edge0)
-        hexlobWireList.append(edge0)
-
-        PntRi = Base.Vector(Ri_x, Ri_y, offSet)
-        PntRi2 = mhex.multiply(PntRe0)
-        edge1 = Part.Arc(PntRe2, PntRi, PntRi2).toShape()
-        # Part.show(edge1)
-        hexlobWireList.append(edge1)
-
-        for i in range(5):
-            PntRe1 = mhex.multiply(PntRe1)
-            PntRe2 = mhex.multiply(PntRe2)
-            edge0 = Part.Arc(PntRi2, PntRe1, PntRe2).toShape()
-            hexlobWireList.append(edge0)
-            PntRi = mhex.multiply(PntRi)
-            PntRi2 = mhex.multiply(PntRi2)
-            if i == 5:
-                edge1 = Part.Arc(PntRe2, PntRi, PntRe0).toShape()
-            else:
-                edge1 = Part.Arc(PntRe2, PntRi, PntRi2).toShape()
-            hexlobWireList.append(edge1)
+        for i in range(6):
+            hexlobWireList.append(Part.Arc(PntRe0[i], PntRe1[i], PntRe2[i]).toShape())
+            hexlobWireList.append(Part.Arc(PntRe2[i], PntRi[i], PntRe0[i + 1]).toShape())
         hexlobWire = Part.Wire(hexlobWireList)
         # Part.show(hWire)
 
@@ -899,50 +1052,53 @@ class Screw:
 
         hexlob = Helo.cut(cutTool)
         # Part.show(hexlob)
-        hexlobFaces = [hexlob.Faces[0]]
-        for i in range(2, 15):
-            hexlobFaces.append(hexlob.Faces[i])
+        faces = hexlob.Faces
+        hexlobFaces = [faces[0]] + faces[2:15]
 
         hexlobShell = Part.Shell(hexlobFaces)
 
-        hexlobShell.Placement.Base = Base.Vector(0.0, 0.0, h_hl)
-        Helo.Placement.Base = Base.Vector(0.0, 0.0, h_hl)
-
         FastenerBase.FSCache[key] = (Helo, hexlobShell)
-        return Helo, hexlobShell
+        return self.placeRecessTool((Helo, hexlobShell), h_hl)
+
+    # return copies of the cached (solid, shell) recess tool with its top at height h
+    def placeRecessTool(self, tool, h):
+        # the cached shapes have an identity placement, so a translation is enough
+        offset = Base.Vector(0.0, 0.0, h)
+        solid, shell = tool[0].copy(), tool[1].copy()
+        solid.translate(offset)
+        shell.translate(offset)
+        return solid, shell
 
     def setTuner(self, myTuner=511):
         self.Tuner = myTuner
 
     def getDia(self, ThreadDiam, isNut):
-        if type(ThreadDiam) == type(""):
-            threadstring = ThreadDiam.strip("()")
-            dia = FsData["DiaList"][threadstring][0]
-        else:
-            dia = ThreadDiam
-        if self.sm3DPrintMode:
-            if isNut:
-                dia = self.smNutThrScaleA * dia + self.smNutThrScaleB
-            else:
-                dia = self.smScrewThrScaleA * dia + self.smScrewThrScaleB
-        return dia
+        return _resolveDia(ThreadDiam, isNut, self.sm3DPrintMode,
+                           self.smNutThrScaleA, self.smNutThrScaleB,
+                           self.smScrewThrScaleA, self.smScrewThrScaleB)
 
     def getLength(self, LenStr):
-        # washers and nuts pass an int (1), for their unused length attribute
-        # handle this circumstance if necessary
-        if type(LenStr) == int:
-            return LenStr
-        # otherwise convert the string to a number using predefined rules
-        if 'in' not in LenStr:
-            LenFloat = float(LenStr)
-        else:
-            components = LenStr.strip('in').split(' ')
-            total = 0
-            for item in components:
-                if '/' in item:
-                    subcmpts = item.split('/')
-                    total += float(subcmpts[0]) / float(subcmpts[1])
-                else:
-                    total += float(item)
-            LenFloat = total * 25.4
-        return LenFloat
+        # convert the length string to a number using predefined rules,
+        # fasteners without a length (nuts, washers) never get here
+        return _parseLength(LenStr)
+
+
+# sizes of the socket screws used most, their recess tools can be prebuilt
+_WARM_SIZES = ("M3", "M4", "M5", "M6", "M8", "M10")
+_recessCacheWarmed = False
+
+
+# fill FSCache with the Allen (ISO 4762) and hexalobular (ISO 14579) recess tools
+# of the common sizes, using the same arguments as the screw builders.
+# called on the GUI thread once the workbench is activated
+def warmRecessCache():
+    global _recessCacheWarmed
+    if _recessCacheWarmed:
+        return
+    _recessCacheWarmed = True
+    s = Screw()
+    for dia in _WARM_SIZES:
+        P, b, dk_max, da, ds_mean, e, lf, k, r, s_mean, t, v, dw, w = FsData["ISO4762def"][dia]
+        s.makeAllen2(s_mean, t, k)
+        tt, A, t = FsData["ISO14579def"][dia]
+        s.makeIso10664_3(tt, t, k)
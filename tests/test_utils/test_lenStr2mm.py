@@ -0,0 +1,21 @@
+from pytest import approx, mark, raises
+from utils import lenStr2mm
+
+
+@mark.parametrize('lenStr, expected', [
+    ('15/16in', 15.0 / 16.0 * 25.4),
+    ('11/16in', 11.0 / 16.0 * 25.4),
+    ('1 1/2in', 1.5 * 25.4),
+    ('.5in', 0.5 * 25.4),
+    ('2in', 2.0 * 25.4),
+    ('12', 12.0),
+])
+def test_lenStr2mm(lenStr, expected):
+    assert lenStr2mm(lenStr) == approx(expected)
+
+
+def test_lenStr2mm_invalid():
+    with raises(ValueError):
+        lenStr2mm('xin')
+    with raises(ZeroDivisionError):
+        lenStr2mm('1/0in')
@@ -1,4 +1,5 @@
 import csv
+import re
 
 # read .csv files into dictionary tables
 # multiple tables can be put in a single file by placing the table name as a single word before the table
@@ -45,3 +46,19 @@ def csv2dict(filename, defaultTableMame, fieldsnamed=True):
                     continue
             cur_table[key] = data
         return tables
+
+# inch lengths of format 'x y/zin', 'y/zin' or 'xin', whole number and fraction separated by a space
+_INCH_RE = re.compile(r'(?:(\d*\.?\d+)\s+)?(\d+)/(\d+)in|(\d*\.?\d+)in')
+
+# convert a length string to mm, inch lengths end with 'in', anything else is in mm
+def lenStr2mm(LenStr):
+    if 'in' not in LenStr:
+        return float(LenStr)
+    m = _INCH_RE.fullmatch(LenStr)
+    if m is None:
+        raise ValueError("invalid inch length: " + LenStr)
+    whole, num, den, single = m.groups()
+    if num is None:
+        return float(single) * 25.4
+    total = float(whole) if whole else 0.0
+    return (total + float(num) / float(den)) * 25.4